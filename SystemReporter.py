@@ -6,7 +6,6 @@ Generates an HTML report of system configuration including hardware details
 
 import platform
 import socket
-import psutil
 import datetime
 import os
 import subprocess
@@ -14,29 +13,95 @@ import json
 import uuid
 import sys
 import re
-import winreg
+import concurrent.futures
+import functools
+import threading
+import heapq
+import time
 from pathlib import Path
 
+# Windows-only; winreg being importable is also the Windows check used to skip
+# the registry and WMI collectors on other systems
+try:
+    import winreg
+except ImportError:
+    winreg = None
+
+try:
+    import pythoncom
+    import win32com.client
+except ImportError:
+    win32com = None
+
+@functools.lru_cache(maxsize=None)
+def _get_net_if_addrs():
+    """Get interface addresses, queried once and shared between collectors"""
+    import psutil
+    return psutil.net_if_addrs()
+
+@functools.lru_cache(maxsize=None)
+def _get_net_if_stats():
+    """Get interface status, queried once and shared between collectors"""
+    import psutil
+    return psutil.net_if_stats()
+
+@functools.lru_cache(maxsize=None)
+def _get_local_ip(hostname):
+    """Get the machine's IPv4 address, preferring interface data over DNS"""
+    # Interface addresses need no network access and are cached for get_network_info;
+    # skip adapters that are down and link-local (APIPA) addresses
+    stats = _get_net_if_stats()
+    for interface, addrs in _get_net_if_addrs().items():
+        stat = stats.get(interface)
+        if stat is None or not stat.isup:
+            continue
+        for addr in addrs:
+            if addr.family == socket.AF_INET and not addr.address.startswith(('127.', '169.254.')):
+                return addr.address
+    
+    # Only resolve the hostname (which may block on DNS) if no interface had one
+    try:
+        for _, _, _, _, sockaddr in socket.getaddrinfo(hostname, None, family=socket.AF_INET):
+            if not sockaddr[0].startswith('127.'):
+                return sockaddr[0]
+    except socket.gaierror:
+        pass
+    return "Unknown"
+
+@functools.lru_cache(maxsize=None)
+def _get_platform():
+    """Get the platform string, computed once per run"""
+    return platform.platform()
+
+@functools.lru_cache(maxsize=None)
+def _get_architecture():
+    """Get the interpreter architecture, computed once per run"""
+    return platform.architecture()
+
 def get_system_info():
     """Get basic system information"""
+    hostname = socket.gethostname()
+    uname = platform.uname()
     info = {
-        'System': platform.system(),
-        'Node Name': platform.node(),
-        'Release': platform.release(),
-        'Version': platform.version(),
-        'Machine': platform.machine(),
-        'Processor': platform.processor(),
-        'Platform': platform.platform(),
-        'Architecture': platform.architecture()[0],
-        'Hostname': socket.gethostname(),
-        'IP Address': socket.gethostbyname(socket.gethostname()),
-        'MAC Address': ':'.join(['{:02x}'.format((uuid.getnode() >> elements) & 0xff) 
-                               for elements in range(0, 8*6, 8)][::-1])
+        'System': uname.system,
+        'Node Name': uname.node,
+        'Release': uname.release,
+        'Version': uname.version,
+        'Machine': uname.machine,
+        'Processor': uname.processor,
+        'Platform': _get_platform(),
+        'Architecture': _get_architecture()[0],
+        'Hostname': hostname,
+        'IP Address': _get_local_ip(hostname),
+        'MAC Address': uuid.getnode().to_bytes(6, 'big').hex(':')
     }
     return info
 
 def get_windows_info():
     """Get Windows-specific information"""
+    if winreg is None:
+        return {'Status': 'N/A on this OS'}
+    
     try:
         # Get Windows version details
         win_ver = platform.win32_ver()
@@ -65,27 +130,32 @@ def get_windows_info():
     
     return windows_info
 
+_WINDOWS_CURRENT_VERSION_PATH = r"SOFTWARE\Microsoft\Windows NT\CurrentVersion"
+
+@functools.lru_cache(maxsize=None)
+def _reg_key(hive, path, access=None):
+    """Open a registry key once and keep the handle for the rest of the run"""
+    return winreg.OpenKey(hive, path, 0, winreg.KEY_READ if access is None else access)
+
+@functools.lru_cache(maxsize=None)
+def _reg_read(hive, path, value, access=None):
+    """Read a registry value once, returning (value, type)"""
+    return winreg.QueryValueEx(_reg_key(hive, path, access), value)
+
 def get_windows_product_key():
     """Retrieve Windows product key (requires admin privileges)"""
     try:
         # Try to read from registry
-        reg_path = r"SOFTWARE\Microsoft\Windows NT\CurrentVersion"
-        value_name = "DigitalProductId"
-        
-        with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, reg_path) as key:
-            value, regtype = winreg.QueryValueEx(key, value_name)
+        value, regtype = _reg_read(winreg.HKEY_LOCAL_MACHINE, _WINDOWS_CURRENT_VERSION_PATH, "DigitalProductId")
             
         # Decode the product key from binary data
         key_map = "BCDFGHJKMPQRTVWXY2346789"
         key_chars = []
-        product_id = list(value[52:67])
-        
-        for i in range(24, -1, -1):
-            k = 0
-            for j in range(14, -1, -1):
-                k = (k << 8) | product_id[j]
-                product_id[j] = k // 24
-                k %= 24
+        # Bytes 52-66 hold the key as a little-endian 120-bit integer in base 24
+        product_id = int.from_bytes(bytes(value[52:67]), 'little')
+        
+        for _ in range(25):
+            product_id, k = divmod(product_id, 24)
             key_chars.append(key_map[k])
         
         # Format the key
@@ -97,27 +167,40 @@ def get_windows_product_key():
 def get_windows_product_id():
     """Get Windows Product ID"""
     try:
-        reg_path = r"SOFTWARE\Microsoft\Windows NT\CurrentVersion"
-        with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, reg_path) as key:
-            value, regtype = winreg.QueryValueEx(key, "ProductId")
-            return value
+        value, regtype = _reg_read(winreg.HKEY_LOCAL_MACHINE, _WINDOWS_CURRENT_VERSION_PATH, "ProductId")
+        return value
     except:
         return "Not available"
 
+# Suppress the console window each PowerShell child would flash (Windows only)
+_CREATE_NO_WINDOW = getattr(subprocess, 'CREATE_NO_WINDOW', 0)
+
+def _run_powershell_json(script):
+    """Run a PowerShell script directly (no cmd.exe) and parse its JSON output"""
+    result = subprocess.run(['powershell', '-NoProfile', '-Command', script],
+                            capture_output=True, text=True, creationflags=_CREATE_NO_WINDOW)
+    if result.returncode == 0 and result.stdout.strip():
+        return json.loads(result.stdout)
+    return None
+
+_LAST_UPDATE_SCRIPT = (
+    "Get-CimInstance Win32_QuickFixEngineering | Sort-Object {[datetime]$_.InstalledOn} -Descending | "
+    "Select-Object -First 1 HotFixID,@{n='InstalledOn';e={([datetime]$_.InstalledOn).ToString('yyyy-MM-dd')}} | "
+    "ConvertTo-Json -Compress"
+)
+
 def get_last_update_time():
     """Get last Windows update time"""
     try:
-        # Check Windows Update history
-        cmd = 'powershell "Get-WmiObject -Class Win32_QuickFixEngineering | Sort-Object InstalledOn -Descending | Select-Object -First 1"'
-        result = subprocess.run(cmd, capture_output=True, text=True, shell=True)
+        # Use the in-process WMI result when pywin32 is available
+        latest_update = _wmi_first('qfe')
+        if _wmi_value(latest_update, 'InstalledOn'):
+            return _wmi_value(latest_update, 'InstalledOn')
         
-        if result.returncode == 0 and result.stdout.strip():
-            lines = result.stdout.split('\n')
-            for line in lines:
-                if 'InstalledOn' in line:
-                    parts = line.split()
-                    if len(parts) >= 3:
-                        return ' '.join(parts[1:])
+        # Check Windows Update history
+        latest_update = _run_powershell_json(_LAST_UPDATE_SCRIPT)
+        if latest_update and latest_update.get('InstalledOn'):
+            return latest_update['InstalledOn']
         
         return "Unknown"
     except:
@@ -126,58 +209,141 @@ def get_last_update_time():
 def get_windows_install_date():
     """Get Windows installation date"""
     try:
-        cmd = 'systeminfo | find "Original Install Date"'
-        result = subprocess.run(cmd, capture_output=True, text=True, shell=True)
-        
-        if result.returncode == 0:
-            return result.stdout.split(':', 1)[1].strip()
+        os_info = _wmi_first('os')
+        if os_info.get('InstallDate'):
+            return os_info['InstallDate']
         return "Unknown"
     except:
         return "Unknown"
 
+# Single PowerShell script returning every CIM class the report needs, used
+# when pywin32 is missing so only one process is spawned for all of them
+_WMI_BUNDLE_SCRIPT = (
+    "@{"
+    "cs=(Get-CimInstance Win32_ComputerSystem | Select-Object Manufacturer,Model); "
+    "bios=(Get-CimInstance Win32_BIOS | Select-Object SerialNumber); "
+    "bb=(Get-CimInstance Win32_BaseBoard | Select-Object Manufacturer,Product); "
+    "cpu=(Get-CimInstance Win32_Processor | Select-Object Name); "
+    "os=(Get-CimInstance Win32_OperatingSystem | Select-Object @{n='InstallDate';e={$_.InstallDate.ToString('yyyy-MM-dd HH:mm:ss')}})"
+    "} | ConvertTo-Json -Compress"
+)
+
+_wmi_lock = threading.Lock()
+
+# CIM datetimes look like yyyymmddHHMMSS.ffffff+UUU
+_CIM_DATETIME_RE = re.compile(r'(\d{4})(\d{2})(\d{2})(\d{2})(\d{2})(\d{2})')
+
+def _format_wmi_datetime(value):
+    """Convert a CIM datetime to a readable string"""
+    match = _CIM_DATETIME_RE.match(value) if isinstance(value, str) else None
+    if not match:
+        return value
+    return "{}-{}-{} {}:{}:{}".format(*match.groups())
+
+def _query_wmi_bundle_com():
+    """Query the bundled CIM classes in-process over a single WMI connection"""
+    # COM must be initialised on whichever collector thread gets here first
+    pythoncom.CoInitialize()
+    try:
+        wmi = win32com.client.GetObject(r"winmgmts:\\.\root\cimv2")
+        
+        def query(wql, props):
+            return [{prop: getattr(item, prop) for prop in props} for item in wmi.ExecQuery(wql)]
+        
+        bundle = {
+            'cs': query("SELECT Manufacturer, Model FROM Win32_ComputerSystem", ['Manufacturer', 'Model']),
+            'bios': query("SELECT SerialNumber FROM Win32_BIOS", ['SerialNumber']),
+            'bb': query("SELECT Manufacturer, Product FROM Win32_BaseBoard", ['Manufacturer', 'Product']),
+            'cpu': query("SELECT Name FROM Win32_Processor", ['Name']),
+            'os': [{'InstallDate': _format_wmi_datetime(row['InstallDate'])}
+                   for row in query("SELECT InstallDate FROM Win32_OperatingSystem", ['InstallDate'])]
+        }
+        
+        # InstalledOn is a plain m/d/yyyy string, so sort on the parsed date
+        updates = []
+        for row in query("SELECT HotFixID, InstalledOn FROM Win32_QuickFixEngineering", ['HotFixID', 'InstalledOn']):
+            try:
+                updates.append((datetime.datetime.strptime(row['InstalledOn'], "%m/%d/%Y"), row))
+            except (TypeError, ValueError):
+                continue
+        if updates:
+            installed_on, latest_update = max(updates, key=lambda update: update[0])
+            bundle['qfe'] = {'HotFixID': latest_update['HotFixID'], 'InstalledOn': installed_on.strftime("%Y-%m-%d")}
+        
+        return bundle
+    finally:
+        # Release the WMI connection (also held by query's closure cell) while
+        # COM is still initialised on this thread, including when a query raised
+        wmi = None
+        pythoncom.CoUninitialize()
+
+def _query_wmi_bundle_powershell():
+    """Run the bundled CIM query through PowerShell and return the parsed JSON"""
+    try:
+        return _run_powershell_json(_WMI_BUNDLE_SCRIPT) or {}
+    except:
+        return {}
+
+@functools.lru_cache(maxsize=None)
+def _query_wmi_bundle():
+    """Run the bundled CIM query once, preferring in-process WMI over PowerShell"""
+    # No WMI off Windows; don't try to spawn PowerShell there
+    if winreg is None:
+        return {}
+    
+    if win32com is not None:
+        try:
+            return _query_wmi_bundle_com()
+        except:
+            pass
+    return _query_wmi_bundle_powershell()
+
+def _collect_wmi_bundle():
+    """Get the cached CIM data (safe to call from several collector threads)"""
+    with _wmi_lock:
+        return _query_wmi_bundle()
+
+def _wmi_first(name):
+    """Get the first instance of a bundled CIM class as a dict"""
+    instance = _collect_wmi_bundle().get(name) or {}
+    if isinstance(instance, list):
+        instance = instance[0] if instance else {}
+    return instance
+
+def _wmi_value(instance, prop):
+    """Get a stripped CIM property value, or None if it is empty"""
+    value = instance.get(prop)
+    if value is None:
+        return None
+    value = str(value).strip()
+    return value or None
+
 def get_hardware_info():
     """Get hardware information (model, manufacturer, serial number)"""
+    if winreg is None:
+        return {'Status': 'N/A on this OS'}
+    
     try:
         hardware_info = {}
         
         # Get computer system info
-        try:
-            cmd = 'wmic computersystem get model,manufacturer'
-            result = subprocess.run(cmd, capture_output=True, text=True, shell=True)
-            if result.returncode == 0:
-                lines = result.stdout.strip().split('\n')
-                if len(lines) > 1:
-                    parts = lines[1].strip().split()
-                    if len(parts) >= 2:
-                        hardware_info['Manufacturer'] = parts[0]
-                        hardware_info['Model'] = ' '.join(parts[1:])
-        except:
-            pass
+        computer_system = _wmi_first('cs')
+        if _wmi_value(computer_system, 'Manufacturer'):
+            hardware_info['Manufacturer'] = _wmi_value(computer_system, 'Manufacturer')
+        if _wmi_value(computer_system, 'Model'):
+            hardware_info['Model'] = _wmi_value(computer_system, 'Model')
         
         # Get BIOS serial number
-        try:
-            cmd = 'wmic bios get serialnumber'
-            result = subprocess.run(cmd, capture_output=True, text=True, shell=True)
-            if result.returncode == 0:
-                lines = result.stdout.strip().split('\n')
-                if len(lines) > 1:
-                    hardware_info['Serial Number'] = lines[1].strip()
-        except:
-            pass
+        bios = _wmi_first('bios')
+        if _wmi_value(bios, 'SerialNumber'):
+            hardware_info['Serial Number'] = _wmi_value(bios, 'SerialNumber')
         
         # Get baseboard info
-        try:
-            cmd = 'wmic baseboard get product,manufacturer'
-            result = subprocess.run(cmd, capture_output=True, text=True, shell=True)
-            if result.returncode == 0:
-                lines = result.stdout.strip().split('\n')
-                if len(lines) > 1:
-                    parts = lines[1].strip().split()
-                    if len(parts) >= 2:
-                        hardware_info['Motherboard Manufacturer'] = parts[0]
-                        hardware_info['Motherboard Model'] = ' '.join(parts[1:])
-        except:
-            pass
+        baseboard = _wmi_first('bb')
+        if _wmi_value(baseboard, 'Manufacturer'):
+            hardware_info['Motherboard Manufacturer'] = _wmi_value(baseboard, 'Manufacturer')
+        if _wmi_value(baseboard, 'Product'):
+            hardware_info['Motherboard Model'] = _wmi_value(baseboard, 'Product')
         
         if not hardware_info:
             hardware_info = {'Error': 'Unable to retrieve hardware information'}
@@ -187,8 +353,19 @@ def get_hardware_info():
     
     return hardware_info
 
+def _has_install_root(app_path, access):
+    """Check whether an Office application key has an InstallRoot Path value"""
+    try:
+        _reg_read(winreg.HKEY_LOCAL_MACHINE, f"{app_path}\\InstallRoot", "Path", access)
+        return True
+    except OSError:
+        return False
+
 def get_office_info():
     """Get Microsoft Office installation information"""
+    if winreg is None:
+        return {'Status': 'N/A on this OS'}
+    
     try:
         office_info = {}
         
@@ -201,44 +378,41 @@ def get_office_info():
             '11.0': 'Office 2003'
         }
         
-        # Check common Office registry paths
-        office_paths = [
-            r"SOFTWARE\Microsoft\Office",
-            r"SOFTWARE\Wow6432Node\Microsoft\Office"
-        ]
+        # Check the 64-bit and 32-bit registry views of the Office key
+        # instead of walking the Wow6432Node path separately
+        office_path = r"SOFTWARE\Microsoft\Office"
+        registry_views = [winreg.KEY_WOW64_64KEY, winreg.KEY_WOW64_32KEY]
         
-        for office_path in office_paths:
+        for view in registry_views:
+            access = winreg.KEY_READ | view
             try:
-                with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, office_path) as key:
-                    for i in range(winreg.QueryInfoKey(key)[0]):
-                        subkey_name = winreg.EnumKey(key, i)
-                        if subkey_name in office_versions:
-                            office_info['Version'] = office_versions[subkey_name]
-                            
-                            # Try to get more details
-                            try:
-                                with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, f"{office_path}\\{subkey_name}\\Common\\InstallRoot") as install_key:
-                                    path, _ = winreg.QueryValueEx(install_key, "Path")
-                                    office_info['Install Path'] = path
-                            except:
-                                pass
-                                
-                            # Try to get product name
-                            try:
-                                with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, f"{office_path}\\{subkey_name}\\Word\\InstallRoot") as word_key:
-                                    path, _ = winreg.QueryValueEx(word_key, "Path")
-                                    office_info['Detected Via'] = 'Word'
-                            except:
-                                try:
-                                    with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, f"{office_path}\\{subkey_name}\\Excel\\InstallRoot") as excel_key:
-                                        path, _ = winreg.QueryValueEx(excel_key, "Path")
-                                        office_info['Detected Via'] = 'Excel'
-                                except:
-                                    office_info['Detected Via'] = 'Registry'
-                            
-                            break
+                key = _reg_key(winreg.HKEY_LOCAL_MACHINE, office_path, access)
+                subkey_names = {winreg.EnumKey(key, i) for i in range(winreg.QueryInfoKey(key)[0])}
             except:
                 continue
+            
+            # Newest installed version wins
+            version = next((v for v in office_versions if v in subkey_names), None)
+            if version is None:
+                continue
+            
+            office_info['Version'] = office_versions[version]
+            version_path = f"{office_path}\\{version}"
+            
+            # Try to get more details
+            try:
+                path, _ = _reg_read(winreg.HKEY_LOCAL_MACHINE, f"{version_path}\\Common\\InstallRoot", "Path", access)
+                office_info['Install Path'] = path
+            except:
+                pass
+            
+            # Report the first Office application that has an install root
+            office_info['Detected Via'] = next(
+                (app for app in ['Word', 'Excel', 'Outlook']
+                 if _has_install_root(f"{version_path}\\{app}", access)),
+                'Registry'
+            )
+            break
         
         # If not found in registry, try to find in common install paths
         if not office_info:
@@ -261,25 +435,32 @@ def get_office_info():
     
     return office_info
 
+@functools.lru_cache(maxsize=None)
+def _get_cpu_freq():
+    """Get CPU frequency, queried once per run"""
+    import psutil
+    return psutil.cpu_freq()
+
 def get_cpu_info():
     """Get CPU information"""
     try:
+        import psutil
+        freq = _get_cpu_freq()
         cpu_info = {
             'Physical Cores': psutil.cpu_count(logical=False),
             'Total Cores': psutil.cpu_count(logical=True),
-            'Max Frequency': f"{psutil.cpu_freq().max:.2f} MHz" if psutil.cpu_freq() else "N/A",
-            'Current Frequency': f"{psutil.cpu_freq().current:.2f} MHz" if psutil.cpu_freq() else "N/A",
-            'CPU Usage': f"{psutil.cpu_percent(interval=1)}%"
+            'Max Frequency': f"{freq.max:.2f} MHz" if freq else "N/A",
+            'Current Frequency': f"{freq.current:.2f} MHz" if freq else "N/A",
+            # Short blocking sample; it overlaps the other collectors and the
+            # equally long process-sampling window, so it adds no wall time
+            'CPU Usage': f"{psutil.cpu_percent(interval=0.3)}%"
         }
         
         # Get CPU name
         try:
-            cmd = 'wmic cpu get name'
-            result = subprocess.run(cmd, capture_output=True, text=True, shell=True)
-            if result.returncode == 0:
-                lines = result.stdout.strip().split('\n')
-                if len(lines) > 1:
-                    cpu_info['Name'] = lines[1].strip()
+            name = _wmi_value(_wmi_first('cpu'), 'Name')
+            if name:
+                cpu_info['Name'] = name
         except:
             pass
             
@@ -291,17 +472,18 @@ def get_cpu_info():
 def get_memory_info():
     """Get memory information"""
     try:
+        import psutil
         virtual_memory = psutil.virtual_memory()
         swap_memory = psutil.swap_memory()
         
         memory_info = {
-            'Total RAM': f"{virtual_memory.total / (1024**3):.2f} GB",
-            'Available RAM': f"{virtual_memory.available / (1024**3):.2f} GB",
-            'Used RAM': f"{virtual_memory.used / (1024**3):.2f} GB",
-            'RAM Usage': f"{virtual_memory.percent}%",
-            'Total Swap': f"{swap_memory.total / (1024**3):.2f} GB",
-            'Used Swap': f"{swap_memory.used / (1024**3):.2f} GB",
-            'Swap Usage': f"{swap_memory.percent}%"
+            'Total RAM': virtual_memory.total,
+            'Available RAM': virtual_memory.available,
+            'Used RAM': virtual_memory.used,
+            'RAM Usage': virtual_memory.percent,
+            'Total Swap': swap_memory.total,
+            'Used Swap': swap_memory.used,
+            'Swap Usage': swap_memory.percent
         }
     except:
         memory_info = {'Error': 'Unable to retrieve memory information'}
@@ -311,18 +493,41 @@ def get_memory_info():
 def get_disk_info():
     """Get disk information"""
     try:
+        import psutil
         disk_info = {}
-        partitions = psutil.disk_partitions()
+        # Skip optical drives and drives without media, which can stall disk_usage
+        partitions = [p for p in psutil.disk_partitions(all=False) if 'cdrom' not in p.opts and p.fstype]
+        
+        # Query every partition on its own daemon thread and leave out any that
+        # haven't answered by a shared 500ms deadline. Daemon threads aren't
+        # joined at exit, so a drive that never answers can't hang the process.
+        usages = {}
+        
+        def query_usage(mountpoint):
+            try:
+                usages[mountpoint] = psutil.disk_usage(mountpoint)
+            except Exception:
+                pass
+        
+        threads = [threading.Thread(target=query_usage, args=(partition.mountpoint,), daemon=True)
+                   for partition in partitions]
+        for thread in threads:
+            thread.start()
+        deadline = time.monotonic() + 0.5
+        for thread in threads:
+            thread.join(max(0, deadline - time.monotonic()))
         
         for partition in partitions:
+            usage = usages.get(partition.mountpoint)
+            if usage is None:
+                continue
             try:
-                usage = psutil.disk_usage(partition.mountpoint)
                 disk_info[partition.device] = {
                     'File System': partition.fstype,
-                    'Total Size': f"{usage.total / (1024**3):.2f} GB",
-                    'Used': f"{usage.used / (1024**3):.2f} GB",
-                    'Free': f"{usage.free / (1024**3):.2f} GB",
-                    'Usage': f"{usage.percent}%",
+                    'Total Size': usage.total,
+                    'Used': usage.used,
+                    'Free': usage.free,
+                    'Usage': usage.percent,
                     'Mount Point': partition.mountpoint
                 }
             except:
@@ -334,8 +539,8 @@ def get_disk_info():
             disk_info['IO Statistics'] = {
                 'Read Count': disk_io.read_count,
                 'Write Count': disk_io.write_count,
-                'Read Bytes': f"{disk_io.read_bytes / (1024**2):.2f} MB",
-                'Write Bytes': f"{disk_io.write_bytes / (1024**2):.2f} MB"
+                'Read Bytes': disk_io.read_bytes,
+                'Write Bytes': disk_io.write_bytes
             }
             
     except:
@@ -344,62 +549,127 @@ def get_disk_info():
     return disk_info
 
 def get_network_info():
-    """Get network information"""
+    """Get network information as one (name, is_up, speed, addresses, io) row per interface"""
     try:
-        network_info = {}
-        addresses = psutil.net_if_addrs()
-        stats = psutil.net_if_stats()
+        import psutil
+        addresses = _get_net_if_addrs()
+        stats = _get_net_if_stats()
         io_counters = psutil.net_io_counters(pernic=True)
         
+        rows = []
         for interface, addrs in addresses.items():
-            network_info[interface] = {
-                'Addresses': [],
-                'Is Up': stats[interface].isup if interface in stats else 'N/A',
-                'Speed': f"{stats[interface].speed} Mbps" if interface in stats and stats[interface].speed else 'N/A'
-            }
+            stat = stats.get(interface)
+            io = io_counters.get(interface)
             
-            for addr in addrs:
-                network_info[interface]['Addresses'].append(
-                    f"{addr.family.name}: {addr.address} (Netmask: {addr.netmask})"
-                )
-        
-        # Add network I/O
-        if io_counters:
-            network_info['IO Statistics'] = {}
-            for interface, io in io_counters.items():
-                network_info['IO Statistics'][interface] = {
-                    'Bytes Sent': f"{io.bytes_sent / (1024**2):.2f} MB",
-                    'Bytes Received': f"{io.bytes_recv / (1024**2):.2f} MB",
-                    'Packets Sent': io.packets_sent,
-                    'Packets Received': io.packets_recv
-                }
+            # Skip interfaces that are down and have never sent anything
+            if stat is not None and not stat.isup and io is not None and io.bytes_sent == 0:
+                continue
+            
+            rows.append((
+                interface,
+                stat.isup if stat is not None else None,
+                stat.speed if stat is not None else 0,
+                [f"{addr.family.name}: {addr.address} (Netmask: {addr.netmask})" for addr in addrs],
+                io
+            ))
+        network_info = {'Interfaces': rows}
                 
     except:
         network_info = {'Error': 'Unable to retrieve network information'}
     
     return network_info
 
+def _safe_proc_attr(proc, method):
+    """Call a psutil Process method, returning None if it cannot be read"""
+    import psutil
+    try:
+        return method()
+    except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+        return None
+
 def get_running_processes(limit=20):
     """Get list of running processes"""
     try:
-        processes = []
-        for proc in psutil.process_iter(['pid', 'name', 'username', 'memory_percent', 'cpu_percent']):
+        import psutil
+        # Prime per-process CPU counters; the first cpu_percent call always returns 0.0
+        procs = []
+        for proc in psutil.process_iter():
             try:
-                processes.append(proc.info)
+                proc.cpu_percent(None)
+                procs.append(proc)
             except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
                 pass
         
-        # Sort by CPU usage and take top N
-        processes.sort(key=lambda x: x['cpu_percent'] or 0, reverse=True)
-        return processes[:limit]
+        # One short sampling window for all processes
+        time.sleep(0.3)
+        
+        # oneshot() lets psutil fetch CPU times and memory from a single kernel query
+        samples = []
+        for proc in procs:
+            try:
+                with proc.oneshot():
+                    samples.append((proc.cpu_percent(None), proc.memory_percent(), proc))
+            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                pass
+        
+        # Take top N by CPU usage, then resolve the expensive fields only for those
+        processes = []
+        for cpu_percent, memory_percent, proc in heapq.nlargest(limit, samples, key=lambda sample: sample[0]):
+            with proc.oneshot():
+                processes.append({
+                    'pid': proc.pid,
+                    'name': _safe_proc_attr(proc, proc.name),
+                    'username': _safe_proc_attr(proc, proc.username),
+                    'memory_percent': memory_percent,
+                    'cpu_percent': cpu_percent
+                })
+        return processes
         
     except:
         return [{'Error': 'Unable to retrieve process information'}]
 
-def generate_html_report(data, output_path="system_report.html"):
-    """Generate HTML report from collected data"""
-    
-    html_template = f"""
+# Precomputed table for escaping report values; one translate() per cell
+_HTML_TR = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;'})
+
+def esc(value):
+    """HTML-escape a value for insertion into the report"""
+    return str(value).translate(_HTML_TR)
+
+# Collectors keep raw numbers; these turn them into display strings at render time
+_GB = 2**30
+_MB = 2**20
+
+def _format_gb(value):
+    """Format a byte count in GB"""
+    return f"{value / _GB:.2f} GB"
+
+def _format_mb(value):
+    """Format a byte count in MB"""
+    return f"{value / _MB:.2f} MB"
+
+def _format_percent(value):
+    """Format a percentage"""
+    return f"{value}%"
+
+_FMT = {
+    'Total RAM': _format_gb,
+    'Available RAM': _format_gb,
+    'Used RAM': _format_gb,
+    'RAM Usage': _format_percent,
+    'Total Swap': _format_gb,
+    'Used Swap': _format_gb,
+    'Swap Usage': _format_percent,
+    'Total Size': _format_gb,
+    'Used': _format_gb,
+    'Free': _format_gb,
+    'Usage': _format_percent,
+    'Read Bytes': _format_mb,
+    'Write Bytes': _format_mb,
+    'Bytes Sent': _format_mb,
+    'Bytes Received': _format_mb
+}
+
+_HTML_HEADER = """
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -407,214 +677,197 @@ def generate_html_report(data, output_path="system_report.html"):
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>System Configuration Report</title>
     <style>
-        body {{
+        body {
             font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
             line-height: 1.6;
             margin: 0;
             padding: 20px;
             background-color: #f5f5f5;
             color: #333;
-        }}
-        .container {{
+        }
+        .container {
             max-width: 1200px;
             margin: 0 auto;
             background: white;
             padding: 30px;
             border-radius: 10px;
             box-shadow: 0 0 20px rgba(0,0,0,0.1);
-        }}
-        .header {{
+        }
+        .header {
             text-align: center;
             margin-bottom: 30px;
             padding-bottom: 20px;
             border-bottom: 3px solid #007acc;
-        }}
-        .header h1 {{
+        }
+        .header h1 {
             color: #007acc;
             margin: 0;
-        }}
-        .timestamp {{
+        }
+        .timestamp {
             color: #666;
             font-style: italic;
-        }}
-        .section {{
+        }
+        .section {
             margin-bottom: 30px;
             padding: 20px;
             border: 1px solid #ddd;
             border-radius: 8px;
             background: #fafafa;
-        }}
-        .section h2 {{
+        }
+        .section h2 {
             color: #007acc;
             margin-top: 0;
             border-bottom: 2px solid #007acc;
             padding-bottom: 10px;
-        }}
-        table {{
+        }
+        table {
             width: 100%;
             border-collapse: collapse;
             margin-top: 15px;
-        }}
-        th, td {{
+        }
+        th, td {
             padding: 12px;
             text-align: left;
             border-bottom: 1px solid #ddd;
-        }}
-        th {{
+        }
+        th {
             background-color: #007acc;
             color: white;
-        }}
-        tr:nth-child(even) {{
+        }
+        tr:nth-child(even) {
             background-color: #f2f2f2;
-        }}
-        tr:hover {{
+        }
+        tr:hover {
             background-color: #e6f3ff;
-        }}
-        .warning {{
+        }
+        .warning {
             color: #ff6b6b;
             font-weight: bold;
-        }}
-        .good {{
+        }
+        .good {
             color: #51cf66;
-        }}
-        .footer {{
+        }
+        .footer {
             text-align: center;
             margin-top: 40px;
             padding-top: 20px;
             border-top: 2px solid #007acc;
             color: #666;
-        }}
-        .sensitive {{
+        }
+        .sensitive {
             font-family: monospace;
             background-color: #ffe6e6;
             padding: 2px 5px;
             border-radius: 3px;
-        }}
+        }
     </style>
 </head>
 <body>
     <div class="container">
         <div class="header">
             <h1>🖥️ System Configuration Report</h1>
-            <p class="timestamp">Generated on: {datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")}</p>
-        </div>
-
-        <!-- System Information -->
-        <div class="section">
-            <h2>📋 System Information</h2>
-            <table>
-                <tr>
-                    <th>Property</th>
-                    <th>Value</th>
-                </tr>
-                {"".join(f'<tr><td>{key}</td><td>{value}</td></tr>' for key, value in data['system_info'].items())}
-            </table>
-        </div>
-
-        <!-- Hardware Information -->
-        <div class="section">
-            <h2>🔧 Hardware Information</h2>
-            <table>
-                <tr>
-                    <th>Property</th>
-                    <th>Value</th>
-                </tr>
-                {"".join(f'<tr><td>{key}</td><td>{value}</td></tr>' for key, value in data['hardware_info'].items())}
-            </table>
-        </div>
-
-        <!-- Windows Information -->
-        <div class="section">
-            <h2>🪟 Windows Information</h2>
-            <table>
-                <tr>
-                    <th>Property</th>
-                    <th>Value</th>
-                </tr>
-                {"".join(f'<tr><td>{key}</td><td>{value if "Key" not in key else "<span class=\"sensitive\">" + value + "</span>"}</td></tr>' for key, value in data['windows_info'].items())}
-            </table>
-        </div>
+"""
 
-        <!-- Office Information -->
-        <div class="section">
-            <h2>📊 Microsoft Office Information</h2>
-            <table>
-                <tr>
-                    <th>Property</th>
-                    <th>Value</th>
-                </tr>
-                {"".join(f'<tr><td>{key}</td><td>{value}</td></tr>' for key, value in data['office_info'].items())}
-            </table>
+_HTML_FOOTER = """
+        <div class="footer">
+            <p>Report generated by System Configuration Reporter</p>
+            <p>© 2024 System Diagnostics Tool</p>
         </div>
+    </div>
+</body>
+</html>
+"""
 
-        <!-- CPU Information -->
+def _write_property_section(out, title, items, sensitive_keys=False):
+    """Write a section with a two-column Property/Value table"""
+    out.write(f"""
         <div class="section">
-            <h2>⚡ CPU Information</h2>
+            <h2>{esc(title)}</h2>
             <table>
                 <tr>
                     <th>Property</th>
                     <th>Value</th>
                 </tr>
-                {"".join(f'<tr><td>{key}</td><td>{value}</td></tr>' for key, value in data['cpu_info'].items())}
-            </table>
+""")
+    for key, value in items.items():
+        value = esc(_FMT.get(key, str)(value))
+        if sensitive_keys and "Key" in key:
+            value = f'<span class="sensitive">{value}</span>'
+        out.write(f'                <tr><td>{esc(key)}</td><td>{value}</td></tr>\n')
+    out.write("""            </table>
         </div>
+""")
 
-        <!-- Memory Information -->
-        <div class="section">
-            <h2>💾 Memory Information</h2>
+def _write_property_table(out, heading, items):
+    """Write an <h3> heading followed by a Property/Value table"""
+    out.write(f"""
+            <h3>{esc(heading)}</h3>
             <table>
-                <tr>
-                    <th>Property</th>
-                    <th>Value</th>
-                </tr>
-                {"".join(f'<tr><td>{key}</td><td>{value}</td></tr>' for key, value in data['memory_info'].items())}
-            </table>
-        </div>
+                <tr><th>Property</th><th>Value</th></tr>
+""")
+    for key, value in items.items():
+        out.write(f'                <tr><td>{esc(key)}</td><td>{esc(_FMT.get(key, str)(value))}</td></tr>\n')
+    out.write("            </table>\n")
 
-        <!-- Disk Information -->
+def _write_html_report(out, data):
+    """Stream the HTML report for the collected data into a writable object"""
+    out.write(_HTML_HEADER)
+    out.write(f'            <p class="timestamp">Generated on: {datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")}</p>\n')
+    out.write("        </div>\n")
+    
+    _write_property_section(out, "📋 System Information", data['system_info'])
+    _write_property_section(out, "🔧 Hardware Information", data['hardware_info'])
+    _write_property_section(out, "🪟 Windows Information", data['windows_info'], sensitive_keys=True)
+    _write_property_section(out, "📊 Microsoft Office Information", data['office_info'])
+    _write_property_section(out, "⚡ CPU Information", data['cpu_info'])
+    _write_property_section(out, "💾 Memory Information", data['memory_info'])
+    
+    # Disk Information
+    out.write("""
         <div class="section">
             <h2>💿 Disk Information</h2>
-            {"".join(f'''
-            <h3>{disk}</h3>
-            <table>
-                <tr><th>Property</th><th>Value</th></tr>
-                {"".join(f'<tr><td>{key}</td><td>{value}</td></tr>' for key, value in info.items())}
-            </table>
-            ''' for disk, info in data['disk_info'].items() if disk != 'IO Statistics')}
-            
-            {f'''
-            <h3>Disk I/O Statistics</h3>
-            <table>
-                <tr><th>Property</th><th>Value</th></tr>
-                {"".join(f'<tr><td>{key}</td><td>{value}</td></tr>' for key, value in data['disk_info'].get('IO Statistics', {}).items())}
-            </table>
-            ''' if 'IO Statistics' in data['disk_info'] else ''}
-        </div>
-
-        <!-- Network Information -->
+""")
+    for disk, info in data['disk_info'].items():
+        if disk != 'IO Statistics':
+            _write_property_table(out, disk, info)
+    if 'IO Statistics' in data['disk_info']:
+        _write_property_table(out, "Disk I/O Statistics", data['disk_info']['IO Statistics'])
+    out.write("        </div>\n")
+    
+    # Network Information
+    out.write("""
         <div class="section">
             <h2>🌐 Network Information</h2>
-            {"".join(f'''
-            <h3>{interface}</h3>
+""")
+    interfaces = data['network_info'].get('Interfaces')
+    if interfaces is None:
+        for key, value in data['network_info'].items():
+            out.write(f'            <p>{esc(key)}: {esc(value)}</p>\n')
+        interfaces = []
+    for interface, is_up, speed, addresses, io in interfaces:
+        out.write(f"""
+            <h3>{esc(interface)}</h3>
             <table>
                 <tr><th>Property</th><th>Value</th></tr>
-                <tr><td>Status</td><td>{info.get("Is Up", "N/A")}</td></tr>
-                <tr><td>Speed</td><td>{info.get("Speed", "N/A")}</td></tr>
-                <tr><td>Addresses</td><td>{"<br>".join(info.get("Addresses", []))}</td></tr>
+                <tr><td>Status</td><td>{esc(is_up if is_up is not None else "N/A")}</td></tr>
+                <tr><td>Speed</td><td>{esc(f"{speed} Mbps" if speed else "N/A")}</td></tr>
+                <tr><td>Addresses</td><td>{"<br>".join(esc(address) for address in addresses)}</td></tr>
             </table>
-            ''' for interface, info in data['network_info'].items() if interface != 'IO Statistics')}
-            
-            {f'''
+""")
+    if any(io is not None for _, _, _, _, io in interfaces):
+        out.write("""
             <h3>Network I/O Statistics</h3>
             <table>
                 <tr><th>Interface</th><th>Bytes Sent</th><th>Bytes Received</th><th>Packets Sent</th><th>Packets Received</th></tr>
-                {"".join(f'<tr><td>{interface}</td><td>{io["Bytes Sent"]}</td><td>{io["Bytes Received"]}</td><td>{io["Packets Sent"]}</td><td>{io["Packets Received"]}</td></tr>' 
-                for interface, io in data['network_info'].get('IO Statistics', {}).items())}
-            </table>
-            ''' if 'IO Statistics' in data['network_info'] else ''}
-        </div>
-
-        <!-- Running Processes -->
+""")
+        for interface, _, _, _, io in interfaces:
+            if io is not None:
+                out.write(f'                <tr><td>{esc(interface)}</td><td>{_FMT["Bytes Sent"](io.bytes_sent)}</td><td>{_FMT["Bytes Received"](io.bytes_recv)}</td><td>{io.packets_sent}</td><td>{io.packets_recv}</td></tr>\n')
+        out.write("            </table>\n")
+    out.write("        </div>\n")
+    
+    # Running Processes
+    out.write("""
         <div class="section">
             <h2>🔄 Top Running Processes (by CPU Usage)</h2>
             <table>
@@ -625,23 +878,22 @@ def generate_html_report(data, output_path="system_report.html"):
                     <th>CPU %</th>
                     <th>Memory %</th>
                 </tr>
-                {"".join(f'<tr><td>{proc.get("pid", "N/A")}</td><td>{proc.get("name", "N/A")}</td><td>{proc.get("username", "N/A")}</td><td>{proc.get("cpu_percent", "N/A")}</td><td>{proc.get("memory_percent", "N/A")}</td></tr>' 
-                for proc in data['processes'])}
-            </table>
+""")
+    for proc in data['processes']:
+        out.write(f'                <tr><td>{esc(proc.get("pid", "N/A"))}</td><td>{esc(proc.get("name", "N/A"))}</td><td>{esc(proc.get("username", "N/A"))}</td><td>{esc(proc.get("cpu_percent", "N/A"))}</td><td>{esc(proc.get("memory_percent", "N/A"))}</td></tr>\n')
+    out.write("""            </table>
         </div>
-
-        <div class="footer">
-            <p>Report generated by System Configuration Reporter</p>
-            <p>© 2024 System Diagnostics Tool</p>
-        </div>
-    </div>
-</body>
-</html>
-"""
+""")
     
+    out.write(_HTML_FOOTER)
+
+def generate_html_report(data, output_path="system_report.html"):
+    """Generate HTML report from collected data"""
     try:
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(html_template)
+        # Stream each section straight to the file instead of building the page in memory;
+        # newline='' skips the \n -> \r\n translation pass on Windows
+        with open(output_path, 'w', encoding='utf-8', newline='', buffering=1024 * 1024) as f:
+            _write_html_report(f, data)
         return True
     except Exception as e:
         print(f"Error generating HTML report: {e}")
@@ -653,19 +905,26 @@ def main():
     print("=" * 40)
     print("Collecting system information...")
     
-    # Collect all system information
-    system_data = {
-        'system_info': get_system_info(),
-        'hardware_info': get_hardware_info(),
-        'windows_info': get_windows_info(),
-        'office_info': get_office_info(),
-        'cpu_info': get_cpu_info(),
-        'memory_info': get_memory_info(),
-        'disk_info': get_disk_info(),
-        'network_info': get_network_info(),
-        'processes': get_running_processes()
+    # Collect all system information concurrently; the collectors spend
+    # most of their time waiting on subprocesses, the registry or psutil
+    collectors = {
+        'system_info': get_system_info,
+        'hardware_info': get_hardware_info,
+        'windows_info': get_windows_info,
+        'office_info': get_office_info,
+        'cpu_info': get_cpu_info,
+        'memory_info': get_memory_info,
+        'disk_info': get_disk_info,
+        'network_info': get_network_info,
+        'processes': get_running_processes
     }
     
+    system_data = {}
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(collectors)) as executor:
+        futures = {executor.submit(func): name for name, func in collectors.items()}
+        for future in concurrent.futures.as_completed(futures):
+            system_data[futures[future]] = future.result()
+    
     # Generate output filename with timestamp
     timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
     output_file = f"system_report_{timestamp}.html"